@@ -35,6 +35,42 @@ def _default_options(opts: IngestOptions | None) -> IngestOptions:
     return opts or IngestOptions()
 
 
+# parse_csv path counters (fast = plain exercise,weight,reps[,unit] with numeric cells; slow = everything else)
+PARSE_CSV_STATS: dict[str, int] = {"fast_path": 0, "slow_path": 0}
+_FAST_CSV_HEADERS = (("exercise", "weight", "reps"), ("exercise", "weight", "reps", "unit"))
+_CSV_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+
+
+def _parse_csv_fast_rows(lines: list[str], fieldnames: list[str]) -> list[tuple[str | None, str, dict]] | None:
+    """
+    Row tuples for the common fixed shape: exercise,weight,reps[,unit] header, no quoting, numeric weight/reps.
+    Returns None as soon as any row falls outside that shape so the general parser handles the whole file.
+    """
+    if tuple(fieldnames) not in _FAST_CSV_HEADERS:
+        return None
+    width = len(fieldnames)
+    row_tuples: list[tuple[str | None, str, dict]] = []
+    for line in lines[1:]:
+        if '"' in line:
+            return None
+        cells = line.split(",")
+        if len(cells) != width:
+            return None
+        ex = cells[0].strip()
+        w, r = cells[1], cells[2]
+        if not _CSV_NUMBER_RE.fullmatch(w) or not _CSV_NUMBER_RE.fullmatch(r):
+            return None
+        if not ex:
+            continue
+        set_dict: dict[str, Any] = {"reps": int(float(r)), "load_type": "weighted", "weight": float(w)}
+        if width == 4 and cells[3]:
+            u = cells[3].strip().lower()
+            if u and u not in ("bodyweight", "bw", "-"):
+                set_dict["unit"] = u
+        row_tuples.append((None, ex, set_dict))
+    return row_tuples
+
+
 def parse_csv(content: str) -> list[tuple[str, list[dict]]]:
     """
     Parse CSV with expected columns: exercise (or Exercise), weight, reps, optional unit, rpe, set_type, date.
@@ -67,69 +103,74 @@ def parse_csv(content: str) -> list[tuple[str, list[dict]]]:
     if not ex_col or not weight_col or not reps_col:
         return []
 
-    rows = list(reader)
-    # Parse weight: bodyweight -> load_type bodyweight (weight null); "+25" -> bodyweight_plus; numeric -> weighted
-    def _parse_weight(val: str) -> tuple[float | None, str, float | None]:
-        """Return (weight_or_none, load_type, added_weight_or_none)."""
-        if val is None or val == "":
-            return (0.0, "weighted", None)
-        v = (val or "").strip()
-        v_lower = v.lower()
-        if v_lower in ("bodyweight", "bw", "-", "—"):
-            return (None, "bodyweight", None)
-        if v.startswith("+") or v_lower.startswith("+"):
+    row_tuples = _parse_csv_fast_rows(lines, fieldnames)
+    if row_tuples is not None:
+        PARSE_CSV_STATS["fast_path"] += 1
+    else:
+        PARSE_CSV_STATS["slow_path"] += 1
+        rows = list(reader)
+        # Parse weight: bodyweight -> load_type bodyweight (weight null); "+25" -> bodyweight_plus; numeric -> weighted
+        def _parse_weight(val: str) -> tuple[float | None, str, float | None]:
+            """Return (weight_or_none, load_type, added_weight_or_none)."""
+            if val is None or val == "":
+                return (0.0, "weighted", None)
+            v = (val or "").strip()
+            v_lower = v.lower()
+            if v_lower in ("bodyweight", "bw", "-", "—"):
+                return (None, "bodyweight", None)
+            if v.startswith("+") or v_lower.startswith("+"):
+                try:
+                    added = float(v.replace("+", "").strip() or 0)
+                    return (None, "bodyweight_plus", added)
+                except (TypeError, ValueError):
+                    return (None, "weighted", None)  # fallback
             try:
-                added = float(v.replace("+", "").strip() or 0)
-                return (None, "bodyweight_plus", added)
+                return (float(v or 0), "weighted", None)
             except (TypeError, ValueError):
-                return (None, "weighted", None)  # fallback
-        try:
-            return (float(v or 0), "weighted", None)
-        except (TypeError, ValueError):
-            return (None, "weighted", None)
+                return (None, "weighted", None)
 
-    # Build rows with (date, exercise, set_dict)
-    row_tuples: list[tuple[str | None, str, dict]] = []
-    for row in rows:
-        raw = {col_map[k]: row.get(col_map[k], "") for k in col_map}
-        ex = (raw.get(ex_col) or "").strip()
-        if not ex:
-            continue
-        try:
-            reps = int(float(raw.get(reps_col, 0)))
-        except (TypeError, ValueError):
-            continue
-        w, load_type, added = _parse_weight(raw.get(weight_col, ""))
-        if w is None and load_type == "weighted":
-            continue  # unparseable weight
-        set_dict: dict[str, Any] = {"reps": reps, "load_type": load_type}
-        if load_type == "weighted":
-            set_dict["weight"] = w if w is not None else 0.0
-        else:
-            set_dict["weight"] = None
-        if load_type == "bodyweight_plus" and added is not None:
-            set_dict["added_weight"] = round(added, 2)
-            if unit_col and raw.get(unit_col):
-                u = raw[unit_col].strip().lower()
-                if u and u not in ("bodyweight", "bw", "-"):
-                    set_dict["added_weight_unit"] = "lb" if u in ("lb", "lbs", "pound", "pounds") else "kg"
-                else:
-                    set_dict["added_weight_unit"] = "lb"
-            else:
-                set_dict["added_weight_unit"] = "lb"
-        if unit_col and raw.get(unit_col) and load_type == "weighted":
-            u = raw[unit_col].strip().lower()
-            if u and u not in ("bodyweight", "bw", "-"):
-                set_dict["unit"] = u
-        if rpe_col and raw.get(rpe_col):
+        # Build rows with (date, exercise, set_dict)
+        row_tuples = []
+        for row in rows:
+            raw = {col_map[k]: row.get(col_map[k], "") for k in col_map}
+            ex = (raw.get(ex_col) or "").strip()
+            if not ex:
+                continue
             try:
-                set_dict["rpe"] = float(raw[rpe_col])
+                reps = int(float(raw.get(reps_col, 0)))
             except (TypeError, ValueError):
-                pass
-        if set_type_col and raw.get(set_type_col):
-            set_dict["set_type"] = raw[set_type_col].strip().lower()
-        date_val = raw.get(date_col, "").strip() if date_col else None
-        row_tuples.append((date_val or None, ex, set_dict))
+                continue
+            w, load_type, added = _parse_weight(raw.get(weight_col, ""))
+            if w is None and load_type == "weighted":
+                continue  # unparseable weight
+            set_dict: dict[str, Any] = {"reps": reps, "load_type": load_type}
+            if load_type == "weighted":
+                set_dict["weight"] = w if w is not None else 0.0
+            else:
+                set_dict["weight"] = None
+            if load_type == "bodyweight_plus" and added is not None:
+                set_dict["added_weight"] = round(added, 2)
+                if unit_col and raw.get(unit_col):
+                    u = raw[unit_col].strip().lower()
+                    if u and u not in ("bodyweight", "bw", "-"):
+                        set_dict["added_weight_unit"] = "lb" if u in ("lb", "lbs", "pound", "pounds") else "kg"
+                    else:
+                        set_dict["added_weight_unit"] = "lb"
+                else:
+                    set_dict["added_weight_unit"] = "lb"
+            if unit_col and raw.get(unit_col) and load_type == "weighted":
+                u = raw[unit_col].strip().lower()
+                if u and u not in ("bodyweight", "bw", "-"):
+                    set_dict["unit"] = u
+            if rpe_col and raw.get(rpe_col):
+                try:
+                    set_dict["rpe"] = float(raw[rpe_col])
+                except (TypeError, ValueError):
+                    pass
+            if set_type_col and raw.get(set_type_col):
+                set_dict["set_type"] = raw[set_type_col].strip().lower()
+            date_val = raw.get(date_col, "").strip() if date_col else None
+            row_tuples.append((date_val or None, ex, set_dict))
 
     if not row_tuples:
         return []
@@ -309,19 +350,33 @@ def _is_plausible_exercise_name(name: str) -> bool:
     return True
 
 
+# (whole-word alias pattern, display); built once into a local and assigned whole, so concurrent text ingests
+# never see a partly filled table
+_context_alias_patterns: tuple[tuple[re.Pattern[str], str], ...] | None = None
+
+
+def _load_context_alias_patterns() -> tuple[tuple[re.Pattern[str], str], ...]:
+    global _context_alias_patterns
+    patterns = _context_alias_patterns
+    if patterns is None:
+        from .normalize import EXERCISE_ALIASES
+        # Whole-word match so "row" doesn't match inside "tomorrow"
+        patterns = tuple(
+            (re.compile(r"(?<![a-z])" + re.escape(alias) + r"s?(?![a-z])"), eid.replace("_", " ").title())
+            for alias, eid in EXERCISE_ALIASES.items()
+        )
+        _context_alias_patterns = patterns
+    return patterns
+
+
 def _infer_exercise_from_context(text_before: str) -> str | None:
     """Return exercise name from text_before (whole-word match); prefer the most recently mentioned."""
-    from .normalize import EXERCISE_ALIASES
     t = text_before.lower()
     found: list[tuple[int, str]] = []  # (position, display_name)
-    for alias, eid in EXERCISE_ALIASES.items():
-        # Whole-word match so "row" doesn't match inside "tomorrow"
-        pat = re.compile(r"(?<![a-z])" + re.escape(alias) + r"s?(?![a-z])")
+    for pat, display in _load_context_alias_patterns():
         matches = list(pat.finditer(t))
         if matches:
-            pos = matches[-1].start()
-            display = eid.replace("_", " ").title()
-            found.append((pos, display))
+            found.append((matches[-1].start(), display))
     if not found:
         return None
     # Prefer the one mentioned most recently (largest position)
@@ -20,6 +20,7 @@ LLMParserLoader = Callable[[], Optional[LLMParserFn]]
 
 _parser: Optional[LLMParserFn] = None  # set via set_llm_parser(); takes precedence
 _env_parser: Optional[LLMParserFn] = None  # lazy-loaded from REPSTACK_LLM_PROVIDER
+_env_loaded = False  # env is read once (even when it configures no parser); see reload_llm_parser()
 
 _PROVIDERS: dict[str, LLMParserLoader] = {}
 
@@ -40,15 +41,23 @@ def set_llm_parser(fn: LLMParserFn | None) -> None:
 def get_llm_parser() -> Optional[LLMParserFn]:
     """Return the configured parser or None.
     Order: 1) set_llm_parser(), 2) env REPSTACK_LLM_PROVIDER (e.g. openai) -> that provider's loader."""
-    global _env_parser
+    global _env_parser, _env_loaded
     if _parser is not None:
         return _parser
-    if _env_parser is not None:
-        return _env_parser
-    _env_parser = _create_parser_from_env()
+    if not _env_loaded:
+        _env_parser = _create_parser_from_env()
+        _env_loaded = True
     return _env_parser
 
 
+def reload_llm_parser() -> Optional[LLMParserFn]:
+    """Drop the cached env/provider parser and re-read REPSTACK_LLM_PROVIDER (e.g. after env changes)."""
+    global _env_parser, _env_loaded
+    _env_parser = None
+    _env_loaded = False
+    return get_llm_parser()
+
+
 def _create_parser_from_env() -> Optional[LLMParserFn]:
     """If REPSTACK_LLM_PROVIDER is set, use that provider's loader. Otherwise None.
     Backward compat: if REPSTACK_OPENAI_API_KEY is set and provider unset, default to openai."""
@@ -14,6 +14,7 @@ from .models import (
     IssueRecord,
     MetricsSignature,
     PRRecord,
+    SessionRecord,
     TopSetRecord,
     WeeklyMetrics,
 )
@@ -39,10 +40,11 @@ def e1rm_brzycki(weight: float, reps: int) -> float:
     return weight * (36.0 / (37.0 - reps))
 
 
+_E1RM_FORMULAS = {"epley": e1rm_epley, "brzycki": e1rm_brzycki}
+
+
 def e1rm(weight: float, reps: int, formula: str) -> float:
-    if formula == "brzycki":
-        return round(e1rm_brzycki(weight, reps), 2)
-    return round(e1rm_epley(weight, reps), 2)
+    return round(_E1RM_FORMULAS.get(formula, e1rm_epley)(weight, reps), 2)
 
 
 def _is_hard_set(set_type: str | None) -> bool:
@@ -65,6 +67,10 @@ def _in_range(date_str: str, start: str, end: str) -> bool:
     return start <= date_str <= end
 
 
+def _session_date(sess: dict | SessionRecord) -> str | None:
+    return sess.date if isinstance(sess, SessionRecord) else sess.get("date")
+
+
 def _normalize_sessions_from_input(payload: ComputeMetricsInput) -> tuple[list[dict], DateRange, int]:
     """Produce list of canonical session dicts, the date range to use, and total set count."""
     if payload.sessions:
@@ -76,15 +82,17 @@ def _normalize_sessions_from_input(payload: ComputeMetricsInput) -> tuple[list[d
             raw.extend(canonical.get("sessions", []))
     if payload.range:
         start, end = payload.range.start, payload.range.end
-        filtered = [s for s in raw if s.get("date") and _in_range(s["date"], start, end)]
+        filtered = [s for s in raw if _session_date(s) and _in_range(_session_date(s), start, end)]
         range_ = payload.range
     else:
-        filtered = [s for s in raw if s.get("date")]
+        filtered = [s for s in raw if _session_date(s)]
         if not filtered:
             range_ = DateRange(start="1970-01-01", end="1970-01-01")
         else:
-            dates = [s["date"] for s in filtered]
+            dates = [_session_date(s) for s in filtered]
             range_ = DateRange(start=min(dates), end=max(dates))
+    # SessionRecord instances are dumped only once they survive the range filter
+    filtered = [s.model_dump() if isinstance(s, SessionRecord) else s for s in filtered]
     total_sets = sum(
         len(ex.get("sets", []))
         for s in filtered
@@ -98,7 +106,7 @@ def compute_metrics_impl(payload: ComputeMetricsInput) -> ComputeMetricsOutput:
     from .models import ComputeMetricsOptions
 
     opts = payload.options or ComputeMetricsOptions()
-    formula = opts.e1rm_formula
+    e1rm_fn = _E1RM_FORMULAS.get(opts.e1rm_formula, e1rm_epley)  # resolved once, not per set
     include_prs = opts.include_prs
 
     sessions, range_, total_sets = _normalize_sessions_from_input(payload)
@@ -176,9 +184,9 @@ def compute_metrics_impl(payload: ComputeMetricsInput) -> ComputeMetricsOutput:
                     if load_type == "bodyweight":
                         e1 = None
                     elif load_type == "bodyweight_plus" and added_weight is not None:
-                        e1 = e1rm(added_weight, reps, formula)
+                        e1 = round(e1rm_fn(added_weight, reps), 2)
                     else:
-                        e1 = e1rm(weight or 0, reps, formula) if weight is not None else None
+                        e1 = round(e1rm_fn(weight, reps), 2) if weight is not None else None
                     sets_by_date_ex[f"{date_str}|{ex_id}"].append((weight, unit, reps, set_type, e1, load_type, added_weight, added_unit))
 
     # Per week
@@ -198,8 +206,9 @@ def compute_metrics_impl(payload: ComputeMetricsInput) -> ComputeMetricsOutput:
         "best_e1rm": None,
         "total_hard_sets": 0,
         "rep_ranges": defaultdict(int),
-        "best_sets": [],  # (date, weight, unit, reps, e1rm)
     })
+    # (ex_id, week_start) -> [(date, weight, unit, reps, e1rm)]; bucketed here so the weekly pass is a lookup
+    best_sets_by_ex_week: dict[tuple[str, str], list[tuple[str, float, str, int, float | None]]] = defaultdict(list)
 
     # Best e1rm per exercise per day for PR detection
     best_per_ex_day: dict[str, dict[str, float]] = defaultdict(dict)  # ex_id -> date -> e1rm
@@ -252,12 +261,12 @@ def compute_metrics_impl(payload: ComputeMetricsInput) -> ComputeMetricsOutput:
             )
             # best_sets / top_sets / PRs: only weighted (or bodyweight_plus with added_weight) so we have a display weight
             if weight is not None:
-                ex_data[ex_id]["best_sets"].append((date_str, weight, unit or "lb", reps, e1))
+                best_sets_by_ex_week[(ex_id, week)].append((date_str, weight, unit or "lb", reps, e1))
                 k = (ex_id, weight, unit or "lb")
                 if reps > rep_prs[k]:
                     rep_prs[k] = reps
             elif load_type == "bodyweight_plus" and added_weight is not None:
-                ex_data[ex_id]["best_sets"].append((date_str, added_weight, added_unit or "lb", reps, e1))
+                best_sets_by_ex_week[(ex_id, week)].append((date_str, added_weight, added_unit or "lb", reps, e1))
                 k = (ex_id, added_weight, added_unit or "lb")
                 if reps > rep_prs[k]:
                     rep_prs[k] = reps
@@ -286,15 +295,15 @@ def compute_metrics_impl(payload: ComputeMetricsInput) -> ComputeMetricsOutput:
         top_sets_list: list[TopSetRecord] = []
         prs_list: list[PRRecord] = []
         if include_prs:
-            for ex_id, d in ex_data.items():
-                for (date_str, weight, unit, reps, e1) in d["best_sets"]:
-                    if _week_start(date_str) == week:
-                        top_sets_list.append(TopSetRecord(
-                            exercise_id=ex_id, weight=weight, unit=unit, reps=reps, e1rm=e1, date=date_str
-                        ))
+            for ex_id in ex_data:
+                week_sets = best_sets_by_ex_week.get((ex_id, week), [])
+                for (date_str, weight, unit, reps, e1) in week_sets:
+                    top_sets_list.append(TopSetRecord(
+                        exercise_id=ex_id, weight=weight, unit=unit, reps=reps, e1rm=e1, date=date_str
+                    ))
                 if ex_id in e1rm_pr_per_ex:
-                    for (date_str, weight, unit, reps, e1) in ex_data[ex_id]["best_sets"]:
-                        if _week_start(date_str) == week and e1 == e1rm_pr_per_ex[ex_id]:
+                    for (date_str, weight, unit, reps, e1) in week_sets:
+                        if e1 == e1rm_pr_per_ex[ex_id]:
                             prs_list.append(PRRecord(
                                 exercise_id=ex_id, kind="e1rm_pr", weight=weight, unit=unit, reps=reps, e1rm=e1, date=date_str
                             ))
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Literal, Optional
+from typing import Annotated, Literal, Optional, Union
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -160,12 +160,26 @@ class SearchExerciseHit(BaseModel):
     match: SearchMatchMetadata
     is_exact_match: bool
 
+    @classmethod
+    def from_search_dict(cls, hit: dict) -> "SearchExerciseHit":
+        """Build from a search_exercises() hit without re-validating (the data is produced internally)."""
+        return cls.model_construct(**{**hit, "match": SearchMatchMetadata.model_construct(**hit["match"])})
+
 
 class SearchExercisesOutput(BaseModel):
     query: str
     count: int
     results: list[SearchExerciseHit] = Field(default_factory=list)
 
+    @classmethod
+    def from_search_dict(cls, data: dict) -> "SearchExercisesOutput":
+        """Build from search_exercises() output without re-validating; model_dump() matches the validated form."""
+        return cls.model_construct(
+            query=data["query"],
+            count=data["count"],
+            results=[SearchExerciseHit.from_search_dict(r) for r in data["results"]],
+        )
+
 
 class IngestLogOutput(BaseModel):
     status: Literal["ok", "needs_clarification", "error"]
@@ -192,9 +206,13 @@ class ComputeMetricsOptions(BaseModel):
     include_prs: bool = True
 
 
+# dict first so plain dicts pass through untouched; SessionRecord instances (e.g. straight from ingest) are kept as-is
+SessionInput = Annotated[Union[dict, SessionRecord], Field(union_mode="left_to_right")]
+
+
 class ComputeMetricsInput(BaseModel):
     """Stateless input: provide either sessions (canonical) or logs (list of { canonical_json })."""
-    sessions: Optional[list[dict]] = None  # canonical session dicts: { date, exercises: [ { exercise_id, sets } ] }
+    sessions: Optional[list[SessionInput]] = None  # canonical sessions: { date, exercises: [ { exercise_id, sets } ] }
     logs: Optional[list[dict]] = None       # list of { canonical_json: { sessions: [...] } }
     range: Optional[DateRange] = None      # optional filter; if omitted, all provided sessions used
     options: Optional[ComputeMetricsOptions] = None
@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import hashlib
+import heapq
 import json
 import re
+import sys
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Iterable, Iterator, Mapping, NamedTuple
 
 from .models import (
     AddedLoad,
@@ -20,21 +25,46 @@ from .models import (
 
 # --- Search query normalization (deterministic, no fuzzy) ---
 
+_QUERY_PUNCT_TABLE = str.maketrans({c: " " for c in "-_/.,;:!'()[]{}"})
+# Simple deterministic plural -> singular for common exercise terms (applied to the end of the query, first match wins)
+_QUERY_SUFFIXES: tuple[tuple[str, str], ...] = (
+    ("pushdowns", "pushdown"),
+    ("flyes", "fly"),
+    ("presses", "press"),
+    ("raises", "raise"),
+    ("curls", "curl"),
+    ("rows", "row"),
+)
+
+
 def normalize_search_query(q: str) -> str:
     """
     Normalize query for matching: lowercase, trim, collapse spaces, remove punctuation.
-    Optional simple plural normalization: pushdowns->pushdown, flyes->fly.
+    Optional simple plural normalization: pushdowns->pushdown, flyes->fly, presses/raises/curls/rows->singular.
     """
     if not q or not isinstance(q, str):
         return ""
-    s = q.strip().lower()
-    s = re.sub(r"[\-_/.,;:!'()\[\]{}]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    # Simple deterministic plural -> singular for common exercise terms
-    if s.endswith("pushdowns"):
-        s = s[:-1]  # pushdowns -> pushdown
-    elif s.endswith("flyes"):
-        s = s[:-2]  # flyes -> fly (remove "es")
+    # Only registry-sized inputs are memoized; arbitrary user input (queries have no length limit) is not kept
+    if len(q) > _query_cache_max_len():
+        return _normalize_search_query.__wrapped__(q)
+    return _normalize_search_query(q)
+
+
+@lru_cache(maxsize=1)
+def _query_cache_max_len() -> int:
+    """Twice the longest registry display/alias: room for extra spaces and punctuation around a real name."""
+    return 2 * max(
+        (len(t) for e in _load_registry() for t in (e.get("display") or "", *(e.get("aliases") or []))),
+        default=0,
+    )
+
+
+@lru_cache(maxsize=1024)
+def _normalize_search_query(q: str) -> str:
+    s = " ".join(q.lower().translate(_QUERY_PUNCT_TABLE).split())
+    for suffix, replacement in _QUERY_SUFFIXES:
+        if s.endswith(suffix):
+            return s[: -len(suffix)] + replacement
     return s
 
 
@@ -69,6 +99,150 @@ def _load_registry() -> list[dict[str, Any]]:
     return _registry
 
 
+# --- Search index: per-entry precomputed fields + prefix trie (built once from the registry) ---
+@dataclass(frozen=True, slots=True)
+class _ExRec:
+    """One registry entry with everything search_exercises compares or returns already stripped/normalized."""
+    exercise_id: str
+    display: str  # stripped
+    display_norm: str
+    aliases: tuple[str, ...]  # as in the registry (returned in hits)
+    aliases_stripped: tuple[str, ...]  # matched_text for alias hits
+    aliases_norm: tuple[str, ...]
+    search_text: str  # display_norm and aliases_norm joined by "\n" (never in a normalized query) for one `in` test
+    equipment_ids: tuple[int, ...]  # indices into _SearchIndex.equipment_vocab (names materialized only for returned hits)
+    movement_pattern: str | None  # stripped; None when empty
+    movement_pattern_lower: str
+
+
+_TRIE_IDS = ""  # node key for registry indices with this prefix (never collides with a 1-char edge)
+
+
+@dataclass(frozen=True, slots=True)
+class _SearchIndex:
+    """Everything search_exercises reads, built together and published as one object."""
+    catalogue: tuple[_ExRec, ...]  # parallel to the registry
+    equipment_vocab: tuple[str, ...]  # every distinct equipment name in the registry, sorted
+    trie: dict[str, Any]
+    trigrams: dict[str, set[int]]  # 3-char substring -> registry indices whose display/alias contains it
+    display_exact_ids: dict[str, list[int]]  # display_norm -> registry indices, in result order (display, index)
+    by_equipment: dict[str, set[int]]  # lowercased equipment -> registry indices
+    by_movement: dict[str, set[int]]  # lowercased movement_pattern -> registry indices
+    max_text_len: int  # longest normalized display/alias; a longer query can't match any strategy
+
+
+# Assigned once, fully built: concurrent first searches (FastMCP runs sync tools in a threadpool) either see
+# None and build their own identical copy, or see the complete index; never a half-filled one.
+_search_index: _SearchIndex | None = None
+
+
+def _entry_equipment(e: dict[str, Any]) -> tuple[str, ...]:
+    eq_raw = e.get("equipment")
+    if eq_raw is None or eq_raw == "":
+        return ()
+    if isinstance(eq_raw, list):
+        return tuple(str(x).strip() for x in eq_raw if x)
+    return (str(eq_raw).strip(),) if str(eq_raw).strip() else ()
+
+
+def _build_ex_rec(e: dict[str, Any], eq_index: dict[str, int]) -> _ExRec:
+    display = (e.get("display") or "").strip()
+    aliases = tuple(e.get("aliases") or [])
+    movement = (e.get("movement_pattern") or "").strip()
+    display_norm = normalize_search_query(display)
+    aliases_norm = tuple(normalize_search_query(a or "") for a in aliases)
+    # Interned: the same ids recur in every hit for this entry
+    return _ExRec(
+        exercise_id=sys.intern(e.get("exercise_id", "")),
+        display=display,
+        display_norm=display_norm,
+        aliases=aliases,
+        aliases_stripped=tuple(sys.intern((a or "").strip()) for a in aliases),
+        aliases_norm=aliases_norm,
+        search_text="\n".join((display_norm, *aliases_norm)),
+        equipment_ids=tuple(eq_index[x] for x in _entry_equipment(e)),
+        movement_pattern=movement or None,
+        movement_pattern_lower=movement.lower(),
+    )
+
+
+def _load_search_index() -> _SearchIndex:
+    """Precompute one _ExRec per registry entry; index every prefix in a character trie and every trigram."""
+    global _search_index
+    index = _search_index
+    if index is not None:
+        return index
+    reg = _load_registry()
+    # Shared string table: records hold small ints, hits look the names up
+    vocab = tuple(sorted({sys.intern(x) for e in reg for x in _entry_equipment(e)}))
+    eq_index = {name: i for i, name in enumerate(vocab)}
+    catalogue: list[_ExRec] = []
+    trie: dict[str, Any] = {}
+    trigrams: dict[str, set[int]] = {}
+    display_exact_ids: dict[str, list[int]] = {}
+    by_equipment: dict[str, set[int]] = {}
+    by_movement: dict[str, set[int]] = {}
+    for idx, e in enumerate(reg):
+        rec = _build_ex_rec(e, eq_index)
+        catalogue.append(rec)
+        for text in (rec.display_norm, *rec.aliases_norm):
+            node = trie
+            for ch in text:
+                node = node.setdefault(ch, {})
+                node.setdefault(_TRIE_IDS, set()).add(idx)
+            for i in range(len(text) - 2):
+                trigrams.setdefault(text[i : i + 3], set()).add(idx)
+        display_exact_ids.setdefault(rec.display_norm, []).append(idx)
+        for eq_id in rec.equipment_ids:
+            eq = vocab[eq_id]
+            if eq:
+                by_equipment.setdefault(eq.lower(), set()).add(idx)
+        if rec.movement_pattern_lower:
+            by_movement.setdefault(rec.movement_pattern_lower, set()).add(idx)
+    for ids in display_exact_ids.values():
+        ids.sort(key=lambda i: (catalogue[i].display, i))
+    index = _SearchIndex(
+        catalogue=tuple(catalogue),
+        equipment_vocab=vocab,
+        trie=trie,
+        trigrams=trigrams,
+        display_exact_ids=display_exact_ids,
+        by_equipment=by_equipment,
+        by_movement=by_movement,
+        max_text_len=max((len(t) for rec in catalogue for t in (rec.display_norm, *rec.aliases_norm)), default=0),
+    )
+    _search_index = index
+    return index
+
+
+def _trie_prefix_ids(index: _SearchIndex, prefix: str) -> set[int]:
+    """Registry indices whose normalized display or an alias starts with prefix; O(len(prefix))."""
+    node = index.trie
+    for ch in prefix:
+        node = node.get(ch)
+        if node is None:
+            return set()
+    return node.get(_TRIE_IDS, set())
+
+
+def _trigram_candidate_ids(index: _SearchIndex, query: str) -> set[int] | None:
+    """
+    Registry indices that may contain query as a substring (every query trigram present); callers still verify
+    with `in`. None when the query is shorter than a trigram and every entry must be checked.
+    """
+    if len(query) < 3:
+        return None
+    ids: set[int] | None = None
+    for i in range(len(query) - 2):
+        posting = index.trigrams.get(query[i : i + 3])
+        if not posting:
+            return set()
+        ids = set(posting) if ids is None else ids & posting
+        if not ids:
+            return ids
+    return ids
+
+
 def _load_source_pack(source: str) -> dict[str, str]:
     """Load alias pack: exporter string (lower) -> exercise_id."""
     global _source_packs_cache
@@ -126,11 +300,11 @@ def resolve_exercise(raw: str, source: str | None = None) -> tuple[str, str, str
     return (f"unmapped:{slug}", display_orig, "unmapped", 0.0)
 
 
-# Match strategy scores (deterministic)
-_SCORE_DISPLAY_EXACT = 1.0
-_SCORE_ALIAS_EXACT = 0.95
-_SCORE_STARTS_WITH = 0.90
-_SCORE_CONTAINS = 0.85
+# Match strategies as small ints, in result order: score desc and exact-before-inexact are both "lower int first".
+# Names and scores (deterministic) are looked up only when a hit dict is built; exact strategies are < _STARTS_WITH.
+_DISPLAY_EXACT, _ALIAS_EXACT, _STARTS_WITH, _CONTAINS = range(4)
+_STRATEGY_NAMES = ("display_exact", "alias_exact", "starts_with", "contains")
+_STRATEGY_SCORES = (1.0, 0.95, 0.90, 0.85)
 
 def search_exercises(
     query: str,
@@ -149,88 +323,176 @@ def search_exercises(
         return {"query": (query or "").strip(), "count": 0, "results": []}
     raw_query = (query or "").strip()
     norm_query = normalize_search_query(raw_query)
-    if not norm_query:
+    if not norm_query or len(norm_query) > _load_search_index().max_text_len:
+        # Too long to match anything: answer empty without keying the result cache on arbitrary user input
         return {"query": raw_query, "count": 0, "results": []}
+    # Cached hits are shared between calls; hand out copies so callers can't mutate the cache
+    hits = _search_impl(norm_query, _search_filter(equipment), _search_filter(movement_pattern), max(0, limit))
+    results = [_copy_hit(h) for h in hits]
+    return {"query": raw_query, "count": len(results), "results": results}
+
+
+def search_exercises_many(
+    requests: list[tuple[str, str | None, str | None, int]],
+) -> list[dict[str, Any]]:
+    """
+    Batch form of search_exercises: each request is (query, equipment, movement_pattern, limit) and gets the
+    response search_exercises would return, in request order. Requests with the same normalized query and
+    filters are scored once at their largest limit; a smaller limit's results are a prefix of that ordering.
+    """
+    reg = _load_registry()
+    max_len = _load_search_index().max_text_len if reg else 0
+    keyed: list[tuple[str, tuple[str, str | None, str | None] | None, int]] = []
+    group_limit: dict[tuple[str, str | None, str | None], int] = {}
+    for query, equipment, movement_pattern, limit in requests:
+        raw_query = (query or "").strip()
+        norm_query = normalize_search_query(raw_query) if reg else ""
+        if not norm_query or len(norm_query) > max_len:
+            keyed.append((raw_query, None, 0))
+            continue
+        key = (norm_query, _search_filter(equipment), _search_filter(movement_pattern))
+        limit = max(0, limit)
+        group_limit[key] = max(limit, group_limit.get(key, 0))
+        keyed.append((raw_query, key, limit))
+    group_hits = {key: _search_impl(*key, limit) for key, limit in group_limit.items()}
     out: list[dict[str, Any]] = []
-    for e in reg:
-        display = (e.get("display") or "").strip()
-        display_norm = normalize_search_query(display)
-        aliases = e.get("aliases") or []
-        alias_norms = [normalize_search_query(a or "") for a in aliases]
-        # Apply filters first
-        if equipment is not None and equipment.strip():
-            eq_val = (e.get("equipment") or "").strip().lower()
-            if isinstance(eq_val, str):
-                eq_list = [eq_val] if eq_val else []
-            else:
-                eq_list = [str(x).strip().lower() for x in eq_val] if eq_val else []
-            if equipment.strip().lower() not in eq_list:
-                continue
-        if movement_pattern is not None and movement_pattern.strip():
-            if (e.get("movement_pattern") or "").strip().lower() != movement_pattern.strip().lower():
-                continue
+    for raw_query, key, limit in keyed:
+        results = [_copy_hit(h) for h in group_hits[key][:limit]] if key is not None else []
+        out.append({"query": raw_query, "count": len(results), "results": results})
+    return out
+
+
+def _search_filter(value: str | None) -> str | None:
+    """Equipment / movement_pattern filter as matched against the indexes (None = no filter)."""
+    return value.strip().lower() if value is not None and value.strip() else None
+
+
+def _copy_hit(hit: Mapping[str, Any]) -> dict[str, Any]:
+    """Mutable response dict (lists, plain dicts) from a frozen cached hit."""
+    out = dict(hit)
+    out["aliases"] = list(hit["aliases"]) if hit["aliases"] is not None else None
+    out["equipment"] = list(hit["equipment"])
+    out["match"] = dict(hit["match"])
+    return out
+
+
+@lru_cache(maxsize=512)
+def _search_impl(
+    norm_query: str,
+    eq_filter: str | None,
+    mp_filter: str | None,
+    limit: int,
+) -> tuple[Mapping[str, Any], ...]:
+    """
+    Sorted, limited hits for an already-normalized query and filters. Pure over the static registry, so cached;
+    hits are read-only (MappingProxyType, tuples) so no caller can corrupt a cached entry. Safe to cache only
+    because _load_search_index never returns a partly built index (a partial result would be kept for good).
+    """
+    index = _load_search_index()
+    catalogue, vocab = index.catalogue, index.equipment_vocab
+    if limit == 0:
+        return ()
+    # Filters resolve to the set of registry indices they allow (None = unfiltered)
+    allowed: set[int] | None = None
+    if eq_filter is not None:
+        allowed = index.by_equipment.get(eq_filter, set())
+    if mp_filter is not None:
+        by_mp = index.by_movement.get(mp_filter, set())
+        allowed = by_mp if allowed is None else allowed & by_mp
+    if limit == 1:
+        # A display_exact hit always sorts first (top score, exact); the index keeps them in result order
+        for idx in index.display_exact_ids.get(norm_query, ()):
+            if allowed is None or idx in allowed:
+                rec = catalogue[idx]
+                return (_search_hit(rec, vocab, _DISPLAY_EXACT, rec.display, norm_query),)
+    # Exact and starts_with hits all live under the query's trie node; contains candidates come from trigram postings
+    prefix_ids = _trie_prefix_ids(index, norm_query)
+    contains_ids = _trigram_candidate_ids(index, norm_query)
+    if contains_ids is None:
+        candidate_ids = range(len(catalogue)) if allowed is None else sorted(allowed)
+    else:
+        matched = prefix_ids | contains_ids
+        candidate_ids = sorted(matched if allowed is None else matched & allowed)
+    # Deterministic sort: score desc, is_exact_match desc (both follow the strategy int), display asc
+    # (registry order breaks ties). Candidates stream into the heap, so only `limit` of them are held at once;
+    # hit dicts are built only for the survivors.
+    candidates = _iter_candidates(catalogue, norm_query, candidate_ids, prefix_ids)
+    top = heapq.nsmallest(limit, candidates) if limit < len(candidate_ids) else sorted(candidates)
+    return tuple(_search_hit(catalogue[c.index], vocab, c.strategy, c.matched_text, norm_query) for c in top)
+
+
+def _iter_candidates(
+    catalogue: tuple[_ExRec, ...],
+    norm_query: str,
+    candidate_ids: Iterable[int],
+    prefix_ids: set[int],
+) -> Iterator[_Candidate]:
+    """Yield a _Candidate for each candidate entry that matches norm_query, with its best strategy."""
+    for idx in candidate_ids:
+        rec = catalogue[idx]
         # Determine best strategy and matched_text
-        strategy: str | None = None
-        score: float = 0.0
+        strategy: int | None = None
         matched_text: str = ""
-        if norm_query == display_norm:
-            strategy = "display_exact"
-            score = _SCORE_DISPLAY_EXACT
-            matched_text = display
-        elif norm_query in alias_norms:
-            idx = alias_norms.index(norm_query)
-            strategy = "alias_exact"
-            score = _SCORE_ALIAS_EXACT
-            matched_text = (aliases[idx] or "").strip()
-        elif display_norm.startswith(norm_query) or any(a and a.startswith(norm_query) for a in alias_norms):
-            strategy = "starts_with"
-            score = _SCORE_STARTS_WITH
+        display_norm, alias_norms = rec.display_norm, rec.aliases_norm
+        is_prefix_hit = idx in prefix_ids
+        if is_prefix_hit and norm_query == display_norm:
+            strategy = _DISPLAY_EXACT
+            matched_text = rec.display
+        elif is_prefix_hit and norm_query in alias_norms:
+            strategy = _ALIAS_EXACT
+            matched_text = rec.aliases_stripped[alias_norms.index(norm_query)]
+        elif is_prefix_hit:
+            strategy = _STARTS_WITH
             if display_norm.startswith(norm_query):
-                matched_text = display
+                matched_text = rec.display
             else:
                 for i, a in enumerate(alias_norms):
                     if a and a.startswith(norm_query):
-                        matched_text = (aliases[i] or "").strip()
+                        matched_text = rec.aliases_stripped[i]
                         break
-        elif norm_query in display_norm or any(norm_query in (a or "") for a in alias_norms):
-            strategy = "contains"
-            score = _SCORE_CONTAINS
+        elif norm_query in rec.search_text:
+            strategy = _CONTAINS
             if norm_query in display_norm:
-                matched_text = display
+                matched_text = rec.display
             else:
                 for i, a in enumerate(alias_norms):
                     if a and norm_query in a:
-                        matched_text = (aliases[i] or "").strip()
+                        matched_text = rec.aliases_stripped[i]
                         break
         if strategy is None:
             continue
-        is_exact = strategy in ("display_exact", "alias_exact")
-        eid = e.get("exercise_id", "")
-        eq_raw = e.get("equipment")
-        if eq_raw is None or eq_raw == "":
-            equipment_list: list[str] = []
-        elif isinstance(eq_raw, list):
-            equipment_list = [str(x).strip() for x in eq_raw if x]
-        else:
-            equipment_list = [str(eq_raw).strip()] if str(eq_raw).strip() else []
-        out.append({
-            "exercise_id": eid,
-            "display": display or None,
-            "aliases": aliases if aliases else None,
-            "equipment": equipment_list,
-            "movement_pattern": (e.get("movement_pattern") or "").strip() or None,
-            "match": {
-                "strategy": strategy,
-                "score": score,
-                "matched_text": matched_text,
-                "normalized_query": norm_query,
-            },
-            "is_exact_match": is_exact,
-        })
-    # Deterministic sort: score desc, is_exact_match desc, display asc
-    out.sort(key=lambda x: (-x["match"]["score"], -x["is_exact_match"], (x["display"] or "")))
-    results = out[: max(0, limit)]
-    return {"query": raw_query, "count": len(results), "results": results}
+        yield _Candidate(strategy, rec.display, idx, matched_text)
+
+
+class _Candidate(NamedTuple):
+    """A scored match; field order is the sort order (index is unique, so matched_text never compares)."""
+    strategy: int
+    display: str
+    index: int
+    matched_text: str
+
+
+def _search_hit(
+    rec: _ExRec,
+    vocab: tuple[str, ...],
+    strategy: int,
+    matched_text: str,
+    norm_query: str,
+) -> Mapping[str, Any]:
+    return MappingProxyType({
+        "exercise_id": rec.exercise_id,
+        "display": rec.display or None,
+        "aliases": rec.aliases or None,
+        "equipment": tuple(vocab[i] for i in rec.equipment_ids),
+        "movement_pattern": rec.movement_pattern,
+        "match": MappingProxyType({
+            "strategy": _STRATEGY_NAMES[strategy],
+            "score": _STRATEGY_SCORES[strategy],
+            "matched_text": matched_text,
+            "normalized_query": norm_query,
+        }),
+        "is_exact_match": strategy < _STARTS_WITH,
+    })
 
 
 def suggest_exercises_for_unmapped(raw: str, max_suggestions: int = 3) -> list[str]:
@@ -293,11 +555,16 @@ EXERCISE_ALIASES: dict[str, str] = {
 }
 
 
+# Unicode-aware on purpose: unmapped ids keep non-ASCII letters (e.g. "Übung" -> "übung")
+_SLUG_STRIP_RE = re.compile(r"[^\w\s-]")
+_SLUG_SEP_RE = re.compile(r"[-\s]+")
+
+
 def slug_exercise(raw: str) -> str:
     """Turn exercise_raw into a slug for unmapped ids."""
     s = raw.strip().lower()
-    s = re.sub(r"[^\w\s-]", "", s)
-    s = re.sub(r"[-\s]+", "_", s)
+    s = _SLUG_STRIP_RE.sub("", s)
+    s = _SLUG_SEP_RE.sub("_", s)
     return s or "unknown"
 
 
@@ -316,13 +583,17 @@ def normalize_unit(unit: str | None, default: str) -> str:
     return default
 
 
+# ASCII digits only: with Unicode \d, e.g. "٢٠٢٥-٠١-١٥" would be passed through as an ISO date
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}", re.ASCII)
+
+
 def normalize_date(value: str | None, hint: str | None) -> str | None:
     """Return YYYY-MM-DD or None if invalid."""
     if not value or not value.strip():
         return hint
     s = value.strip()
     # Already YYYY-MM-DD
-    if re.match(r"^\d{4}-\d{2}-\d{2}$", s):
+    if _ISO_DATE_RE.fullmatch(s):
         return s
     # Try common formats
     for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%m-%d-%Y", "%d-%m-%Y"):
@@ -333,11 +604,15 @@ def normalize_date(value: str | None, hint: str | None) -> str | None:
     return hint
 
 
+# Built once: json.dumps(..., sort_keys=True) constructs a new encoder on every call.
+# Output must stay byte-identical (default separators, ASCII) so published hashes don't change.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True)
+
+
 def canonical_sha256(log: CanonicalLog) -> str:
     """Stable SHA256 of canonical JSON (sorted keys)."""
-    import json as _json
-    blob = _json.dumps(log.model_dump(), sort_keys=True)
-    return hashlib.sha256(blob.encode()).hexdigest()
+    blob = _CANONICAL_ENCODER.encode(log.model_dump())
+    return hashlib.sha256(blob.encode("ascii")).hexdigest()
 
 
 def normalize_set(
@@ -5,11 +5,11 @@ from __future__ import annotations
 from fastmcp import FastMCP
 
 from .ingest import ingest_log_impl
+from .llm_parser import get_llm_parser
 from .metrics import compute_metrics_impl
 from .models import (
     ComputeMetricsInput,
     IngestLogInput,
-    SearchExerciseHit,
     SearchExercisesInput,
     SearchExercisesOutput,
 )
@@ -25,12 +25,10 @@ def repstack_ingest_log(payload: dict) -> dict:
     Stateless: does not store anything. Set allow_llm=true for text and configure an LLM parser to use it; response includes meta.llm_available and meta.llm_used.
     """
     inp = IngestLogInput.model_validate(payload)
-    llm_parser = None
     try:
-        from .llm_parser import get_llm_parser
-        llm_parser = get_llm_parser()
+        llm_parser = get_llm_parser()  # cached after the first call; reload_llm_parser() re-reads env
     except Exception:
-        pass
+        llm_parser = None
     result = ingest_log_impl(inp, llm_parser=llm_parser)
     return result.model_dump()
 
@@ -63,12 +61,7 @@ def repstack_search_exercises(payload: dict) -> dict:
         movement_pattern=inp.movement_pattern,
         limit=max(0, min(limit, 100)),
     )
-    out = SearchExercisesOutput(
-        query=data["query"],
-        count=data["count"],
-        results=[SearchExerciseHit(**r) for r in data["results"]],
-    )
-    return out.model_dump()
+    return SearchExercisesOutput.from_search_dict(data).model_dump()
 
 
 def run() -> None:
@@ -0,0 +1,19 @@
+"""
+Shared setup for the sample scripts: project paths and file helpers.
+Importing this module puts the project root on sys.path so `repstack` is importable when a script is run directly.
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SAMPLES_DIR = ROOT / "samples"
+
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def read_text(path: Path) -> str:
+    """Read a sample file as UTF-8 (invalid bytes replaced) in one read + decode, without a text-mode wrapper."""
+    return path.read_bytes().decode("utf-8", "replace")
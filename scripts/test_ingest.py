@@ -5,37 +5,60 @@ Usage: python scripts/test_ingest.py [sample_dir]
 """
 from __future__ import annotations
 
+import multiprocessing as mp
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
-ROOT = Path(__file__).resolve().parent.parent
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+from _common import SAMPLES_DIR, read_text  # also puts the project root on sys.path
 
-from repstack.ingest import ingest_log_impl
-from repstack.models import IngestLogInput, IngestOptions, LogInput, UserInput
+from repstack.models import IngestLogInput, IngestLogOutput, IngestOptions, LogInput, UserInput
 from repstack.normalize import format_set_display
 
+from _ingest_cache import cached_ingest, warm
 
-SAMPLES_DIR = ROOT / "samples"
 
-SAMPLES = [
-    ("good_workout.csv", "csv", {}),
-    ("good_workout_with_date.csv", "csv", {"session_date_hint": "2025-02-01"}),
-    ("csv_app_export.csv", "csv", {}),
-    ("hevy_style_export.csv", "csv", {"session_date_hint": "2025-02-05"}),
-    ("unmapped_close_match.csv", "csv", {"session_date_hint": "2025-01-15"}),
-    ("bodyweight_heavy_session.csv", "csv", {}),
-    ("bad_workout.csv", "csv", {}),
-    ("empty_columns.csv", "csv", {}),
-    ("good_workout.json", "json", {}),
-    ("good_workout_sessions.json", "json", {"session_date_hint": "2025-02-01"}),
-    ("json_user.js", "json", {}),
-    ("bad_workout.json", "json", {}),
-    ("invalid_workout.json", "json", {}),
-    ("good_workout.txt", "text", {"allow_llm": False}),
-    ("messy_workout.txt", "text", {"allow_llm": False}),
-]
+@dataclass(frozen=True, slots=True)
+class SampleSpec:
+    filename: str
+    content_type: str
+    opts: IngestOptions | None = None  # prebuilt once at import
+
+
+SAMPLES: tuple[SampleSpec, ...] = (
+    SampleSpec("good_workout.csv", "csv"),
+    SampleSpec("good_workout_with_date.csv", "csv", IngestOptions(session_date_hint="2025-02-01")),
+    SampleSpec("csv_app_export.csv", "csv"),
+    SampleSpec("hevy_style_export.csv", "csv", IngestOptions(session_date_hint="2025-02-05")),
+    SampleSpec("unmapped_close_match.csv", "csv", IngestOptions(session_date_hint="2025-01-15")),
+    SampleSpec("bodyweight_heavy_session.csv", "csv"),
+    SampleSpec("bad_workout.csv", "csv"),
+    SampleSpec("empty_columns.csv", "csv"),
+    SampleSpec("good_workout.json", "json"),
+    SampleSpec("good_workout_sessions.json", "json", IngestOptions(session_date_hint="2025-02-01")),
+    SampleSpec("json_user.js", "json"),
+    SampleSpec("bad_workout.json", "json"),
+    SampleSpec("invalid_workout.json", "json"),
+    SampleSpec("good_workout.txt", "text", IngestOptions(allow_llm=False)),
+    SampleSpec("messy_workout.txt", "text", IngestOptions(allow_llm=False)),
+)
+
+
+_USER = UserInput(default_unit="lb", timezone="America/New_York")
+
+
+def _ingest_one(args: tuple[SampleSpec, str]) -> dict:
+    """Ingest one sample file; module-level so a process pool can pickle it. Returns IngestLogOutput as a dict."""
+    spec, samples_dir = args
+    content = read_text(Path(samples_dir) / spec.filename)
+    payload = IngestLogInput(
+        user=_USER,
+        log_input=LogInput(content_type=spec.content_type, content=content),
+        options=spec.opts,
+    )
+    return cached_ingest(payload).model_dump()
 
 
 def main() -> None:
@@ -44,50 +67,64 @@ def main() -> None:
         print(f"Not a directory: {samples_dir}")
         sys.exit(1)
 
-    user = UserInput(default_unit="lb", timezone="America/New_York")
-
-    for filename, content_type, opts in SAMPLES:
-        path = samples_dir / filename
-        if not path.exists():
-            print(f"[SKIP] {filename} (file not found)")
+    present = set(os.listdir(samples_dir))
+    jobs: list[tuple[SampleSpec, str]] = []
+    for spec in SAMPLES:
+        if spec.filename not in present:
+            print(f"[SKIP] {spec.filename} (file not found)")
             continue
-
-        content = path.read_text(encoding="utf-8", errors="replace")
-        options = IngestOptions(**opts) if opts else None
-        payload = IngestLogInput(
-            user=user,
-            log_input=LogInput(content_type=content_type, content=content),
-            options=options,
-        )
-
-        print(f"\n{'='*60}")
-        print(f"FILE: {filename}  (content_type={content_type})")
-        print("=" * 60)
-
-        result = ingest_log_impl(payload)
-
-        warnings_count = sum(1 for i in result.issues if i.severity == "warning")
-        print(f"Status: {result.status}")
-        print(f"Log ID: {result.log_id or '(none)'}")
-        print(f"Confidence: {result.summary.confidence:.2f}")
-        print(f"Warnings: {warnings_count}")
-        print(f"Summary: sessions={result.summary.sessions_detected}  exercises={result.summary.exercises_detected}  sets={result.summary.sets_detected}")
+        jobs.append((spec, str(samples_dir)))
+
+    # Samples are independent and CPU-bound: ingest in parallel, then print in SAMPLES order.
+    # On Linux, fork after loading the registry and cache fingerprint so workers inherit them instead of
+    # re-importing and re-reading them; other platforms keep their default start method.
+    results: list[dict] = []
+    if jobs:
+        ctx = mp.get_context("fork") if sys.platform.startswith("linux") else None
+        if ctx is not None:
+            warm()
+        with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1), mp_context=ctx) as pool:
+            results = list(pool.map(_ingest_one, jobs))
+
+    for (spec, _dir), data in zip(jobs, results):
+        result = IngestLogOutput.model_validate(data)
+
+        # one pass over issues: count warnings and format the issue lines
+        warnings_count = 0
+        issue_lines: list[str] = []
+        for i in result.issues:
+            if i.severity == "warning":
+                warnings_count += 1
+            issue_lines.append(f"  - [{i.severity}] {i.type}: {i.message}")
+
+        # build the whole block and write it once per sample
+        lines = [
+            f"\n{'='*60}",
+            f"FILE: {spec.filename}  (content_type={spec.content_type})",
+            "=" * 60,
+            f"Status: {result.status}",
+            f"Log ID: {result.log_id or '(none)'}",
+            f"Confidence: {result.summary.confidence:.2f}",
+            f"Warnings: {warnings_count}",
+            f"Summary: sessions={result.summary.sessions_detected}  exercises={result.summary.exercises_detected}  sets={result.summary.sets_detected}",
+        ]
         if result.meta:
-            print(f"Meta: {result.meta}")
-        if result.issues:
-            print("Issues:")
-            for i in result.issues:
-                print(f"  - [{i.severity}] {i.type}: {i.message}")
+            lines.append(f"Meta: {result.meta}")
+        if issue_lines:
+            lines.append("Issues:")
+            lines.extend(issue_lines)
         if result.canonical_log.sessions:
-            print("Canonical (first session):")
+            lines.append("Canonical (first session):")
             sess = result.canonical_log.sessions[0]
-            print(f"  date={sess.date}  exercises={len(sess.exercises)}")
+            lines.append(f"  date={sess.date}  exercises={len(sess.exercises)}")
             for ex in sess.exercises[:3]:
                 sets_str = ", ".join(format_set_display(s) for s in ex.sets[:5])
-                print(f"    {ex.exercise_display}: {sets_str}")
-        print()
+                lines.append(f"    {ex.exercise_display}: {sets_str}")
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     print("(Stateless: no data persisted)")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -5,14 +5,12 @@ Usage: python scripts/test_metrics.py [sample_dir]
 """
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 
-ROOT = Path(__file__).resolve().parent.parent
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+from _common import SAMPLES_DIR, read_text  # also puts the project root on sys.path
 
-from repstack.ingest import ingest_log_impl
 from repstack.metrics import compute_metrics_impl
 from repstack.models import (
     ComputeMetricsInput,
@@ -20,34 +18,37 @@ from repstack.models import (
     IngestLogInput,
     IngestOptions,
     LogInput,
+    SessionRecord,
     UserInput,
 )
 
+from _ingest_cache import cached_ingest
 
-SAMPLES_DIR = ROOT / "samples"
+
+_USER = UserInput(default_unit="lb", timezone="UTC")
 
 
 def main() -> None:
     samples_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else SAMPLES_DIR
+    present = set(os.listdir(samples_dir)) if samples_dir.is_dir() else set()
     # Ingest sample files (stateless), collect canonical sessions
-    all_sessions: list[dict] = []
+    all_sessions: list[SessionRecord] = []
     for name, path in [
         ("week1", samples_dir / "good_workout.csv"),
         ("week2", samples_dir / "good_workout_with_date.csv"),
     ]:
-        if not path.exists():
+        if path.name not in present:
             continue
-        content = path.read_text(encoding="utf-8", errors="replace")
+        content = read_text(path)
         date_hint = "2025-01-27" if name == "week1" else "2025-02-01"
         payload = IngestLogInput(
-            user=UserInput(default_unit="lb", timezone="UTC"),
+            user=_USER,
             log_input=LogInput(content_type="csv", content=content),
             options=IngestOptions(session_date_hint=date_hint),
         )
-        result = ingest_log_impl(payload)
+        result = cached_ingest(payload)
         if result.status == "ok" and result.canonical_log.sessions:
-            for s in result.canonical_log.sessions:
-                all_sessions.append(s.model_dump())
+            all_sessions.extend(result.canonical_log.sessions)
             print(f"Ingested {name}: log_id={result.log_id}  sets={result.summary.sets_detected}")
 
     if not all_sessions:
@@ -58,18 +59,22 @@ def main() -> None:
     metrics_input = ComputeMetricsInput(sessions=all_sessions, range=range_)
     metrics = compute_metrics_impl(metrics_input)
 
-    print("\n" + "=" * 60)
-    print("COMPUTE_METRICS (stateless)")
-    print("=" * 60)
-    print(f"Status: {metrics.status}")
-    print(f"Range: {metrics.range.start} to {metrics.range.end}")
-    print("\nWeekly:")
+    lines = [
+        "\n" + "=" * 60,
+        "COMPUTE_METRICS (stateless)",
+        "=" * 60,
+        f"Status: {metrics.status}",
+        f"Range: {metrics.range.start} to {metrics.range.end}",
+        "\nWeekly:",
+    ]
     for w in metrics.weekly:
         flags = f"  flags={w.flags}" if w.flags else ""
-        print(f"  {w.week_start}: sessions={w.sessions}  hard_sets={w.hard_sets}  tonnage_lb={w.tonnage_lb}{flags}")
-    print("\nExercise summaries (top 5):")
+        lines.append(f"  {w.week_start}: sessions={w.sessions}  hard_sets={w.hard_sets}  tonnage_lb={w.tonnage_lb}{flags}")
+    lines.append("\nExercise summaries (top 5):")
     for ex in metrics.exercise_summaries[:5]:
-        print(f"  {ex.exercise_id}: sessions={ex.sessions}  best_e1rm={ex.best_e1rm}  hard_sets={ex.total_hard_sets}")
+        lines.append(f"  {ex.exercise_id}: sessions={ex.sessions}  best_e1rm={ex.best_e1rm}  hard_sets={ex.total_hard_sets}")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -9,17 +9,28 @@ import json
 import sys
 from pathlib import Path
 
-ROOT = Path(__file__).resolve().parent.parent
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+from _common import SAMPLES_DIR, read_text  # also puts the project root on sys.path
 
-from repstack.models import SearchExercisesInput, SearchExercisesOutput, SearchExerciseHit
+from repstack.models import SearchExercisesInput
 from repstack.normalize import search_exercises
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
-SAMPLES_DIR = ROOT / "samples"
 EXAMPLES_FILE = SAMPLES_DIR / "search_exercises_examples.json"
 
+_DEC = json.JSONDecoder()
+_ENC = json.JSONEncoder(indent=2)  # display stays on stdlib json so the printed payloads are unchanged
+
+
+def _load_examples(path: Path):
+    """Parse the examples file, with orjson when installed."""
+    text = read_text(path)
+    return orjson.loads(text) if orjson is not None else _DEC.decode(text)
+
 
 def main() -> None:
     examples_path = Path(sys.argv[1]) if len(sys.argv) > 1 else EXAMPLES_FILE
@@ -27,7 +38,7 @@ def main() -> None:
         print(f"File not found: {examples_path}")
         sys.exit(1)
 
-    data = json.loads(examples_path.read_text(encoding="utf-8"))
+    data = _load_examples(examples_path)
     if "examples" in data and isinstance(data["examples"], list) and data["examples"]:
         examples = data["examples"]
     else:
@@ -36,30 +47,34 @@ def main() -> None:
     for i, ex in enumerate(examples):
         name = ex.get("name", f"example_{i+1}")
         payload = ex.get("payload", ex)
-        print(f"\n{'='*60}")
-        print(f"Example: {name}")
-        print("Payload:", json.dumps(payload, indent=2)[:200] + ("..." if len(json.dumps(payload)) > 200 else ""))
-        print("=" * 60)
+        pretty = _ENC.encode(payload)
+        lines = [
+            f"\n{'='*60}",
+            f"Example: {name}",
+            "Payload: " + pretty[:200] + ("..." if len(pretty) > 200 else ""),
+            "=" * 60,
+        ]
         try:
             inp = SearchExercisesInput.model_validate(payload)
             limit = inp.limit if inp.limit is not None else 20
-            hits = search_exercises(
+            resp = search_exercises(
                 query=inp.query,
                 equipment=inp.equipment,
                 movement_pattern=inp.movement_pattern,
                 limit=max(0, min(limit, 100)),
             )
-            out = SearchExercisesOutput(exercises=[SearchExerciseHit(**h) for h in hits])
-            result = out.model_dump()
-            print(f"Found {len(result['exercises'])} exercise(s)")
-            for h in result["exercises"][:8]:
-                print(f"  - {h['exercise_id']}: {h.get('display')} ({h.get('equipment')}, {h.get('movement_pattern')})")
-            if len(result["exercises"]) > 8:
-                print(f"  ... and {len(result['exercises']) - 8} more")
+            hits = resp["results"]
+            lines.append(f"Found {resp['count']} exercise(s)")
+            for h in hits[:8]:
+                lines.append(f"  - {h['exercise_id']}: {h.get('display')} ({h.get('equipment')}, {h.get('movement_pattern')})")
+            if len(hits) > 8:
+                lines.append(f"  ... and {len(hits) - 8} more")
         except Exception as e:
-            print(f"Error: {e}")
+            lines.append(f"Error: {e}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     print()
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -1,12 +1,10 @@
 """Deterministic CSV parse test for fitness.ingest_log."""
 
-import tempfile
-from pathlib import Path
-
 import pytest
 
-from repstack.ingest import ingest_log_impl, parse_csv
-from repstack.models import IngestLogInput, IngestOptions, LogInput, UserInput
+from repstack.ingest import PARSE_CSV_STATS, ingest_log_impl, parse_csv
+from repstack.models import IngestLogInput, IngestOptions, LogInput, LogInputSource, UserInput
+from repstack.normalize import resolve_exercise
 
 
 def test_parse_csv_deterministic() -> None:
@@ -15,7 +13,9 @@ Bench Press,135,5,lb
 Bench Press,145,4,lb
 Squat,225,5,lb
 """
+    fast_before = PARSE_CSV_STATS["fast_path"]
     parsed = parse_csv(content)  # list of (date|None, [(ex, sets), ...])
+    assert PARSE_CSV_STATS["fast_path"] == fast_before + 1
     assert len(parsed) == 1
     _, ex_list = parsed[0]
     assert len(ex_list) == 2
@@ -34,7 +34,9 @@ def test_parse_csv_bodyweight_and_plus() -> None:
 Pull Ups,Bodyweight,10,
 Pull Ups,+25,6,lb
 """
+    slow_before = PARSE_CSV_STATS["slow_path"]
     parsed = parse_csv(content)
+    assert PARSE_CSV_STATS["slow_path"] == slow_before + 1
     assert len(parsed) == 1
     _, ex_list = parsed[0]
     assert len(ex_list) == 1
@@ -45,6 +47,35 @@ Pull Ups,+25,6,lb
     assert sets[1]["weight"] is None and sets[1]["load_type"] == "bodyweight_plus" and sets[1]["added_weight"] == 25 and sets[1]["reps"] == 6
 
 
+@pytest.mark.parametrize(
+    "content, path",
+    [
+        ("exercise,weight,reps\nBench Press,135,5\nSquat,225.5,3\n", "fast_path"),
+        ("Exercise,Weight,Reps,Unit\nBench Press,60,5,KG\n", "fast_path"),
+        ("exercise,weight,reps,unit\nPull Ups,+25,6,lb\n", "slow_path"),
+        ("exercise,weight,reps\n\"Press, Bench\",135,5\n", "slow_path"),
+        ("date,exercise,weight,reps\n2025-01-15,Squat,225,5\n", "slow_path"),
+        ("exercise,weight,reps,rpe\nSquat,225,5,8\n", "slow_path"),
+    ],
+)
+def test_parse_csv_fast_path_selection(content: str, path: str) -> None:
+    """Plain exercise,weight,reps[,unit] CSVs with numeric cells take the fast path; anything else falls back."""
+    before = dict(PARSE_CSV_STATS)
+    parse_csv(content)
+    other = "slow_path" if path == "fast_path" else "fast_path"
+    assert PARSE_CSV_STATS[path] == before[path] + 1
+    assert PARSE_CSV_STATS[other] == before[other]
+
+
+def test_parse_csv_fast_path_set_shape() -> None:
+    """Fast-path sets have the same shape as the general parser's (unit lowercased, weight float, reps int)."""
+    parsed = parse_csv("exercise,weight,reps,unit\nBench Press,135,5,LB\nBench Press,140,5.0,\n")
+    assert parsed == [(None, [("Bench Press", [
+        {"reps": 5, "load_type": "weighted", "weight": 135.0, "unit": "lb"},
+        {"reps": 5, "load_type": "weighted", "weight": 140.0},
+    ])])]
+
+
 def test_ingest_log_csv_returns_canonical_and_tonnage() -> None:
     payload = IngestLogInput(
         user=UserInput(default_unit="lb", timezone="UTC"),
@@ -74,22 +105,24 @@ Squat,225,5
     assert result.signature.parser_version
 
 
-def test_seated_row_maps_to_seated_row_not_barbell_row() -> None:
-    """Conservative mapping: Seated Row must map to seated_row, not barbell_row."""
-    from repstack.normalize import resolve_exercise_id
-    eid, _ = resolve_exercise_id("Seated Row")
-    assert eid == "seated_row"
-    eid2, _ = resolve_exercise_id("Barbell Row")
-    assert eid2 == "barbell_row"
-
-
-def test_romanian_deadlift_maps_to_romanian_deadlift_not_deadlift() -> None:
-    """Conservative mapping: Romanian Deadlift maps to romanian_deadlift, not deadlift."""
-    from repstack.normalize import resolve_exercise_id
-    eid, _ = resolve_exercise_id("Romanian Deadlift")
-    assert eid == "romanian_deadlift"
-    eid2, _ = resolve_exercise_id("Deadlift")
-    assert eid2 == "deadlift"
+@pytest.mark.parametrize(
+    "name, expected, forbidden",
+    [
+        ("Seated Row", "seated_row", "barbell_row"),
+        ("Barbell Row", "barbell_row", None),
+        ("Romanian Deadlift", "romanian_deadlift", "deadlift"),
+        ("Deadlift", "deadlift", None),
+        ("Incline Barbell Bench Press", "incline_barbell_bench_press", "barbell_bench_press"),
+        ("Barbell Bench Press", "barbell_bench_press", None),
+        ("Smith Machine Bench Press", "smith_machine_bench_press", "barbell_bench_press"),
+        ("Dumbbell Bench Press", "dumbbell_bench_press", "barbell_bench_press"),
+    ],
+)
+def test_resolver_conservative_mapping(name: str, expected: str, forbidden: str | None) -> None:
+    """Conservative mapping: variants resolve to their own id and are never swapped for the base lift."""
+    eid, _, _, _ = resolve_exercise(name)
+    assert eid == expected
+    assert eid != forbidden
 
 
 def test_unmapped_exercise_emits_issue_with_location_and_raw_excerpt() -> None:
@@ -130,35 +163,8 @@ def test_unmapped_exercise_includes_suggested_ids_when_close_match() -> None:
     assert len(unmapped_issues[0].suggested_exercise_ids) <= 3
 
 
-def test_swap_prevention_incline_vs_flat_bench() -> None:
-    """Incline Barbell Bench Press must not map to flat barbell_bench_press."""
-    from repstack.normalize import resolve_exercise
-    eid, _, strategy, _ = resolve_exercise("Incline Barbell Bench Press")
-    assert eid == "incline_barbell_bench_press"
-    assert eid != "barbell_bench_press"
-    eid_flat, _, _, _ = resolve_exercise("Barbell Bench Press")
-    assert eid_flat == "barbell_bench_press"
-
-
-def test_swap_prevention_smith_vs_barbell() -> None:
-    """Smith Machine Bench Press must not map to barbell_bench_press."""
-    from repstack.normalize import resolve_exercise
-    eid, _, _, _ = resolve_exercise("Smith Machine Bench Press")
-    assert eid == "smith_machine_bench_press"
-    assert eid != "barbell_bench_press"
-
-
-def test_swap_prevention_dumbbell_vs_barbell_bench() -> None:
-    """Dumbbell Bench Press must not map to barbell_bench_press."""
-    from repstack.normalize import resolve_exercise
-    eid, _, _, _ = resolve_exercise("Dumbbell Bench Press")
-    assert eid == "dumbbell_bench_press"
-    assert eid != "barbell_bench_press"
-
-
 def test_source_pack_resolution_when_source_provided() -> None:
     """When log_input.source.app is set (e.g. hevy), source pack is used first."""
-    from repstack.models import LogInputSource
     payload = IngestLogInput(
         user=UserInput(default_unit="lb", timezone="UTC"),
         log_input=LogInput(
@@ -10,6 +10,9 @@ from repstack.models import (
     UserInput,
 )
 
+_USER = UserInput(default_unit="lb", timezone="UTC")
+_BENCH_CSV = "exercise,weight,reps\nBench Press,135,5"
+
 
 def test_messy_workout_returns_needs_clarification() -> None:
     """Messy input (invalid lines + one valid Squat 225x5) -> confidence < 0.70, needs_clarification."""
@@ -19,7 +22,7 @@ def test_messy_workout_returns_needs_clarification() -> None:
 Squat 225x5
 """
     payload = IngestLogInput(
-        user=UserInput(default_unit="lb", timezone="UTC"),
+        user=_USER,
         log_input=LogInput(content_type="text", content=content),
         options=IngestOptions(allow_llm=False),
     )
@@ -32,10 +35,10 @@ Squat 225x5
 def test_missing_date_with_strictness_strict_blocks() -> None:
     """When strictness=strict and session date is missing, status is needs_clarification."""
     payload = IngestLogInput(
-        user=UserInput(default_unit="lb", timezone="UTC"),
+        user=_USER,
         log_input=LogInput(
             content_type="csv",
-            content="exercise,weight,reps\nBench Press,135,5",
+            content=_BENCH_CSV,
         ),
         options=IngestOptions(strictness="strict"),  # no session_date_hint
     )
@@ -48,7 +51,7 @@ def test_missing_date_with_strictness_strict_blocks() -> None:
 def test_confidence_penalties_applied() -> None:
     """Confidence is reduced by missing_date and unmapped exercise."""
     payload = IngestLogInput(
-        user=UserInput(default_unit="lb", timezone="UTC"),
+        user=_USER,
         log_input=LogInput(
             content_type="csv",
             content="exercise,weight,reps\nBench Press,135,5\nUnknownExercise,95,10",
@@ -63,7 +66,7 @@ def test_confidence_penalties_applied() -> None:
 def test_log_id_none_when_status_needs_clarification() -> None:
     """When status is needs_clarification, log_id is None."""
     payload = IngestLogInput(
-        user=UserInput(default_unit="lb", timezone="UTC"),
+        user=_USER,
         log_input=LogInput(content_type="csv", content="exercise,weight\nOnlyTwoCols,135"),
     )
     result = ingest_log_impl(payload)
@@ -74,10 +77,10 @@ def test_log_id_none_when_status_needs_clarification() -> None:
 def test_ok_with_date_hint_returns_log_id() -> None:
     """When date hint provided and data valid, status ok and log_id set."""
     payload = IngestLogInput(
-        user=UserInput(default_unit="lb", timezone="UTC"),
+        user=_USER,
         log_input=LogInput(
             content_type="csv",
-            content="exercise,weight,reps\nBench Press,135,5",
+            content=_BENCH_CSV,
         ),
         options=IngestOptions(session_date_hint="2025-02-01"),
     )
@@ -90,7 +93,7 @@ def test_ok_with_date_hint_returns_log_id() -> None:
 def test_tool_output_contains_no_ellipses() -> None:
     """MCP tool response JSON must not contain truncation markers (...)."""
     payload = IngestLogInput(
-        user=UserInput(default_unit="lb", timezone="UTC"),
+        user=_USER,
         log_input=LogInput(
             content_type="csv",
             content="exercise,weight,reps\nBench Press,135,5\nSquat,225,5\nDeadlift,315,3\n",
@@ -98,41 +101,47 @@ def test_tool_output_contains_no_ellipses() -> None:
         options=IngestOptions(session_date_hint="2025-01-15"),
     )
     result = ingest_log_impl(payload)
-    out = result.model_dump()
-    import json
-    js = json.dumps(out, default=str)
+    js = result.model_dump_json()
     assert "..." not in js, "Tool output must not contain ellipses truncation"
 
 
-def test_confidence_lower_with_warnings() -> None:
-    """Clean CSV with date -> high confidence; missing_date or unmapped lowers it."""
-    clean = IngestLogInput(
-        user=UserInput(default_unit="lb", timezone="UTC"),
-        log_input=LogInput(
-            content_type="csv",
-            content="exercise,weight,reps\nBench Press,135,5\nSquat,225,5",
-        ),
-        options=IngestOptions(session_date_hint="2025-01-15"),
-    )
-    r_clean = ingest_log_impl(clean)
-    assert r_clean.summary.confidence >= 0.85
+# Payload parts are built from validated values, so model_construct skips re-validating them
+_CLEAN = IngestLogInput.model_construct(
+    user=_USER,
+    log_input=LogInput.model_construct(content_type="csv", content=_BENCH_CSV + "\nSquat,225,5"),
+    options=IngestOptions(session_date_hint="2025-01-15"),
+)
+_UNMAPPED = IngestLogInput.model_construct(
+    user=_USER,
+    log_input=LogInput.model_construct(content_type="csv", content=_BENCH_CSV + "\nSomeWeirdLift,95,8"),
+    options=IngestOptions(session_date_hint="2025-01-15"),
+)
+_NO_DATE = IngestLogInput.model_construct(
+    user=_USER,
+    log_input=LogInput.model_construct(content_type="csv", content=_BENCH_CSV),
+    options=IngestOptions(),
+)
 
-    unmapped = IngestLogInput(
-        user=UserInput(default_unit="lb", timezone="UTC"),
-        log_input=LogInput(
-            content_type="csv",
-            content="exercise,weight,reps\nBench Press,135,5\nSomeWeirdLift,95,8",
-        ),
-        options=IngestOptions(session_date_hint="2025-01-15"),
-    )
-    r_unmapped = ingest_log_impl(unmapped)
-    assert r_unmapped.summary.confidence < r_clean.summary.confidence
-    assert any(i.type == "unmapped_exercise" for i in r_unmapped.issues)
-
-    no_date = IngestLogInput(
-        user=UserInput(default_unit="lb", timezone="UTC"),
-        log_input=LogInput(content_type="csv", content="exercise,weight,reps\nBench Press,135,5"),
-        options=IngestOptions(),
-    )
-    r_no_date = ingest_log_impl(no_date)
-    assert r_no_date.summary.confidence < r_clean.summary.confidence
+
+@pytest.fixture(scope="module")
+def clean_confidence() -> float:
+    """Confidence of the clean CSV-with-date payload, computed once for the module."""
+    return ingest_log_impl(_CLEAN).summary.confidence
+
+
+def test_clean_csv_with_date_has_high_confidence(clean_confidence: float) -> None:
+    """Clean CSV with date -> high confidence."""
+    assert clean_confidence >= 0.85
+
+
+@pytest.mark.parametrize(
+    "payload, expect_issue",
+    [(_UNMAPPED, "unmapped_exercise"), (_NO_DATE, None)],
+    ids=["unmapped", "no_date"],
+)
+def test_confidence_lower_with_warnings(clean_confidence: float, payload: IngestLogInput, expect_issue: str | None) -> None:
+    """missing_date or unmapped lowers confidence below the clean case."""
+    result = ingest_log_impl(payload)
+    assert result.summary.confidence < clean_confidence
+    if expect_issue:
+        assert any(i.type == expect_issue for i in result.issues)
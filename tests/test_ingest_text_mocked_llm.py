@@ -3,7 +3,8 @@
 import pytest
 
 from repstack.ingest import ingest_log_impl
-from repstack.llm_parser import set_llm_parser
+from repstack import llm_parser
+from repstack.llm_parser import get_llm_parser, register_llm_provider, reload_llm_parser, set_llm_parser
 from repstack.models import IngestLogInput, IngestOptions, LogInput, UserInput
 
 
@@ -68,3 +69,27 @@ def test_ingest_text_allow_llm_true_no_parser_adds_warning_and_falls_back() -> N
     assert result.meta is not None
     assert result.meta.get("llm_available") is False
     assert result.meta.get("llm_used") is False
+
+
+def test_env_provider_loaded_once_until_reload(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The env/provider parser is resolved once and cached; reload_llm_parser() re-reads env."""
+    calls: list[int] = []
+
+    def _loader():
+        calls.append(1)
+        return _mock_llm_parser
+
+    register_llm_provider("mock_test", _loader)
+    set_llm_parser(None)
+    monkeypatch.setenv("REPSTACK_LLM_PROVIDER", "mock_test")
+    try:
+        assert reload_llm_parser() is _mock_llm_parser
+        assert get_llm_parser() is _mock_llm_parser
+        assert len(calls) == 1
+        monkeypatch.delenv("REPSTACK_LLM_PROVIDER")
+        assert get_llm_parser() is _mock_llm_parser  # still cached
+        assert reload_llm_parser() is None
+    finally:
+        monkeypatch.delenv("REPSTACK_LLM_PROVIDER", raising=False)
+        llm_parser._PROVIDERS.pop("mock_test", None)
+        reload_llm_parser()
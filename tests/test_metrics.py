@@ -9,16 +9,63 @@ from repstack.models import (
     DateRange,
     IngestLogInput,
     LogInput,
+    SessionRecord,
     UserInput,
 )
 
 
+_SET = {"set_index": 0, "weight": 100.0, "unit": "lb", "reps": 5, "load_type": "weighted"}
+
+_DETERMINISTIC_SESSIONS = [
+    {
+        "session_id": "s1",
+        "date": "2025-01-06",
+        "exercises": [
+            {
+                "exercise_raw": "Squat",
+                "exercise_id": "back_squat",
+                "exercise_display": "Back Squat",
+                "sets": [
+                    {"set_index": 0, "weight": 100.0, "unit": "lb", "reps": 5, "load_type": "weighted"},
+                    {"set_index": 1, "weight": 100.0, "unit": "lb", "reps": 5, "load_type": "weighted"},
+                ],
+            }
+        ],
+    }
+]
+
+
+@pytest.fixture(scope="module")
+def huge_session_list() -> list[dict]:
+    """MAX_SESSIONS + 1 empty sessions, built once per module."""
+    return [{"session_id": f"s{i}", "date": "2025-01-06", "exercises": []} for i in range(MAX_SESSIONS + 1)]
+
+
+@pytest.fixture(scope="module")
+def huge_set_session() -> list[dict]:
+    """One session with MAX_SETS + 1 sets; the guardrail only counts sets, so they share one dict."""
+    return [
+        {
+            "session_id": "s1",
+            "date": "2025-01-06",
+            "exercises": [
+                {
+                    "exercise_raw": "Squat",
+                    "exercise_id": "back_squat",
+                    "exercise_display": "Back Squat",
+                    "sets": [_SET] * (MAX_SETS + 1),
+                }
+            ],
+        }
+    ]
+
+
 def _ingest_csv(
     csv_content: str,
     session_date: str,
     user_id: str | None = None,
-) -> tuple[str, list[dict]]:
-    """Ingest CSV (stateless) and return (user_id, list of canonical session dicts)."""
+) -> tuple[str, list[SessionRecord]]:
+    """Ingest CSV (stateless) and return (user_id, canonical sessions as SessionRecords)."""
     from repstack.models import IngestOptions
 
     payload = IngestLogInput(
@@ -28,8 +75,7 @@ def _ingest_csv(
     )
     result = ingest_log_impl(payload)
     assert result.status == "ok", result.issues
-    sessions = [s.model_dump() for s in result.canonical_log.sessions]
-    return result.user_id, sessions
+    return result.user_id, result.canonical_log.sessions
 
 
 def test_metrics_tonnage_and_volume_spike() -> None:
@@ -52,10 +98,12 @@ def test_metrics_tonnage_and_volume_spike() -> None:
         range=DateRange(start="2025-01-01", end="2025-01-31"),
     )
     result = compute_metrics_impl(payload)
+    weeks = {w.week_start: w for w in result.weekly}
+    exercises_by_id = {e.exercise_id: e for e in result.exercise_summaries}
     assert result.status == "ok"
     assert len(result.weekly) >= 2
-    w1 = next((w for w in result.weekly if w.week_start == "2025-01-06"), None)
-    w2 = next((w for w in result.weekly if w.week_start == "2025-01-13"), None)
+    w1 = weeks.get("2025-01-06")
+    w2 = weeks.get("2025-01-13")
     assert w1 is not None
     assert w2 is not None
     assert w1.tonnage_lb == 1000.0
@@ -64,7 +112,7 @@ def test_metrics_tonnage_and_volume_spike() -> None:
     assert w2.hard_sets == 2
     assert "volume_spike" in w2.flags
     assert len(result.exercise_summaries) >= 1
-    squat = next((e for e in result.exercise_summaries if e.exercise_id == "back_squat"), None)
+    squat = exercises_by_id.get("back_squat")
     assert squat is not None
     assert squat.total_hard_sets == 4
     assert squat.sessions == 2
@@ -84,8 +132,9 @@ def test_metrics_bodyweight_excluded_from_tonnage() -> None:
         range=DateRange(start="2025-01-01", end="2025-01-31"),
     )
     result = compute_metrics_impl(payload)
+    weeks = {w.week_start: w for w in result.weekly}
     assert result.status == "ok"
-    w1 = next((w for w in result.weekly if w.week_start == "2025-01-06"), None)
+    w1 = weeks.get("2025-01-06")
     assert w1 is not None
     assert w1.tonnage_lb == 825.0
     assert w1.hard_sets == 3
@@ -95,73 +144,29 @@ def test_metrics_bodyweight_excluded_from_tonnage() -> None:
 
 def test_metrics_deterministic_same_input() -> None:
     """Same input always yields the same output (no storage, no randomness)."""
-    sessions = [
-        {
-            "session_id": "s1",
-            "date": "2025-01-06",
-            "exercises": [
-                {
-                    "exercise_raw": "Squat",
-                    "exercise_id": "back_squat",
-                    "exercise_display": "Back Squat",
-                    "sets": [
-                        {"set_index": 0, "weight": 100.0, "unit": "lb", "reps": 5, "load_type": "weighted"},
-                        {"set_index": 1, "weight": 100.0, "unit": "lb", "reps": 5, "load_type": "weighted"},
-                    ],
-                }
-            ],
-        }
-    ]
     payload = ComputeMetricsInput(
-        sessions=sessions,
+        sessions=_DETERMINISTIC_SESSIONS,
         range=DateRange(start="2025-01-01", end="2025-01-31"),
     )
     result1 = compute_metrics_impl(payload)
     result2 = compute_metrics_impl(payload)
-    assert result1.model_dump() == result2.model_dump()
+    assert result1.model_dump_json() == result2.model_dump_json()
     assert result1.status == "ok"
     assert len(result1.weekly) == 1
     assert result1.weekly[0].tonnage_lb == 1000.0
 
 
-def test_metrics_guardrail_max_sessions() -> None:
+def test_metrics_guardrail_max_sessions(huge_session_list: list[dict]) -> None:
     """Payload with more than MAX_SESSIONS returns needs_clarification and payload_too_large."""
-    sessions = [
-        {
-            "session_id": f"s{i}",
-            "date": "2025-01-06",
-            "exercises": [],
-        }
-        for i in range(MAX_SESSIONS + 1)
-    ]
-    payload = ComputeMetricsInput(sessions=sessions, range=DateRange(start="2025-01-01", end="2025-01-31"))
+    payload = ComputeMetricsInput(sessions=huge_session_list, range=DateRange(start="2025-01-01", end="2025-01-31"))
     result = compute_metrics_impl(payload)
     assert result.status == "needs_clarification"
     assert any(i.type == "payload_too_large" and "sessions" in i.message for i in result.issues)
 
 
-def test_metrics_guardrail_max_sets() -> None:
+def test_metrics_guardrail_max_sets(huge_set_session: list[dict]) -> None:
     """Payload with more than MAX_SETS returns needs_clarification and payload_too_large."""
-    # One session with many sets
-    sets = [
-        {"set_index": i, "weight": 100.0, "unit": "lb", "reps": 5, "load_type": "weighted"}
-        for i in range(MAX_SETS + 1)
-    ]
-    sessions = [
-        {
-            "session_id": "s1",
-            "date": "2025-01-06",
-            "exercises": [
-                {
-                    "exercise_raw": "Squat",
-                    "exercise_id": "back_squat",
-                    "exercise_display": "Back Squat",
-                    "sets": sets,
-                }
-            ],
-        }
-    ]
-    payload = ComputeMetricsInput(sessions=sessions, range=DateRange(start="2025-01-01", end="2025-01-31"))
+    payload = ComputeMetricsInput(sessions=huge_set_session, range=DateRange(start="2025-01-01", end="2025-01-31"))
     result = compute_metrics_impl(payload)
     assert result.status == "needs_clarification"
     assert any(i.type == "payload_too_large" and "sets" in i.message for i in result.issues)
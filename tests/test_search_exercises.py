@@ -1,13 +1,19 @@
 """Tests for repstack.search_exercises: deterministic ordering, match metadata, equipment array."""
 
+import copy
+import sys
+import threading
+
 import pytest
 
+from repstack import normalize
+
 from repstack.models import (
     SearchExerciseHit,
     SearchExercisesInput,
     SearchExercisesOutput,
 )
-from repstack.normalize import normalize_search_query, search_exercises
+from repstack.normalize import normalize_search_query, search_exercises, search_exercises_many
 
 
 def test_search_response_shape() -> None:
@@ -143,6 +149,25 @@ def test_normalize_search_query() -> None:
     assert normalize_search_query("incline-dumbbell") == "incline dumbbell"
     assert normalize_search_query("pushdowns") == "pushdown"
     assert normalize_search_query("flyes") == "fly"
+    assert normalize_search_query("Cable Rows") == "cable row"
+    assert normalize_search_query("bench presses") == "bench press"
+
+
+@pytest.mark.parametrize(
+    "query, expected_id",
+    [
+        ("lateral raises", "lateral_raise"),
+        ("cable rows", "cable_row"),
+        ("barbell curls", "barbell_curl"),
+        ("Hammer Curls", "hammer_curl"),
+    ],
+)
+def test_plural_query_matches_singular_display(query: str, expected_id: str) -> None:
+    """Plural queries normalize to the singular display (deterministic suffix rules, no fuzzy matching)."""
+    data = search_exercises(query, limit=3)
+    top = data["results"][0]
+    assert top["exercise_id"] == expected_id
+    assert top["match"]["strategy"] == "display_exact"
 
 
 def test_search_filter_equipment() -> None:
@@ -186,6 +211,29 @@ def test_search_no_match_returns_empty() -> None:
     assert data["results"] == []
 
 
+def test_contains_matches_mid_word_substring() -> None:
+    """contains is a substring match: 'ench' (trigram-indexed) and 'ss' (shorter than a trigram) still hit."""
+    data = search_exercises("ench", limit=100)
+    ids = [r["exercise_id"] for r in data["results"]]
+    assert "barbell_bench_press" in ids
+    assert all(r["match"]["strategy"] == "contains" for r in data["results"])
+    assert all("ench" in normalize_search_query(r["match"]["matched_text"]) for r in data["results"])
+    short = search_exercises("ss", limit=100)
+    assert short["count"] > 0
+    assert all("ss" in normalize_search_query(r["match"]["matched_text"]) for r in short["results"])
+
+
+def test_repeat_search_unaffected_by_caller_mutation() -> None:
+    """Results are cached internally; mutating a returned hit must not leak into the next call."""
+    first = search_exercises("row", limit=20)
+    expected = copy.deepcopy(first["results"])
+    first["results"][0]["match"]["score"] = -1
+    first["results"][0]["equipment"].append("mutated")
+    first["results"].clear()
+    second = search_exercises("row", limit=20)
+    assert second["results"] == expected
+
+
 def test_search_exercises_output_serialization() -> None:
     """SearchExercisesOutput builds from search_exercises dict and serializes for tool output."""
     inp = SearchExercisesInput(query="squat", limit=5)
@@ -207,3 +255,80 @@ def test_search_exercises_output_serialization() -> None:
         assert "match" in h
         assert h["match"]["strategy"] in ("display_exact", "alias_exact", "starts_with", "contains")
         assert "is_exact_match" in h
+
+
+def test_search_output_from_search_dict_matches_validated() -> None:
+    """SearchExercisesOutput.from_search_dict (no re-validation) dumps exactly like the validated model."""
+    for query, kwargs in (("squat", {"limit": 5}), ("bench", {}), ("row", {"equipment": "cable"}), ("xyz", {})):
+        data = search_exercises(query, **kwargs)
+        validated = SearchExercisesOutput(
+            query=data["query"],
+            count=data["count"],
+            results=[SearchExerciseHit(**r) for r in data["results"]],
+        )
+        fast = SearchExercisesOutput.from_search_dict(data)
+        assert fast.model_dump() == validated.model_dump()
+        assert fast.model_dump_json() == validated.model_dump_json()
+
+
+def test_search_exercises_many_matches_single_calls() -> None:
+    """Batch results equal per-request search_exercises, including shared queries with different limits."""
+    requests = [
+        ("squat", None, None, 5),
+        ("  Squat ", None, None, 2),
+        ("press", "barbell", None, 20),
+        ("", None, None, 5),
+        ("squat", None, None, 0),
+    ]
+    batch = search_exercises_many(requests)
+    assert batch == [search_exercises(q, equipment=eq, movement_pattern=mp, limit=n) for q, eq, mp, n in requests]
+    batch[0]["results"][0]["equipment"].append("mutated")
+    assert batch[1]["results"][0]["equipment"] == search_exercises("squat", limit=1)["results"][0]["equipment"]
+
+
+def test_concurrent_first_searches_see_full_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Searches racing the lazy index build (FastMCP runs sync tools in a threadpool) all get complete results."""
+    expected = search_exercises("bench", limit=50)
+    monkeypatch.setattr(normalize, "_search_index", None)
+    normalize._search_impl.cache_clear()
+    n_threads = 8
+    barrier = threading.Barrier(n_threads)
+    results: list[object] = [None] * n_threads
+
+    def worker(i: int) -> None:
+        barrier.wait()
+        try:
+            results[i] = search_exercises("bench", limit=50)
+        except Exception as e:  # surfaced by the assert below
+            results[i] = e
+
+    old_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(n_threads)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(old_interval)
+    assert results == [expected] * n_threads
+    # The cached result for this key was computed during the race; it must be the complete one
+    assert search_exercises("bench", limit=50) == expected
+
+
+def test_long_query_normalization_not_memoized() -> None:
+    """Inputs far longer than any registry name are normalized without entering the normalization cache."""
+    long_query = "Bench  Press " * 10_000
+    before = normalize._normalize_search_query.cache_info().currsize
+    assert normalize_search_query(long_query) == " ".join(["bench press"] * 10_000)
+    assert normalize._normalize_search_query.cache_info().currsize == before
+
+
+def test_overlong_query_returns_empty_without_caching() -> None:
+    """A query longer than every registry name can't match; it is answered without entering the result cache."""
+    long_query = "bench press " * 50_000
+    before = normalize._search_impl.cache_info().currsize
+    assert search_exercises(long_query) == {"query": long_query.strip(), "count": 0, "results": []}
+    assert search_exercises_many([(long_query, None, None, 5)]) == [{"query": long_query.strip(), "count": 0, "results": []}]
+    assert normalize._search_impl.cache_info().currsize == before